@@ -15,14 +15,119 @@ and creates insightful visualizations.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend: figures are only written to disk
 import matplotlib.pyplot as plt
 import glob
-import seaborn as sns
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from numba import njit
 
 # Set display options for clean output formatting
 pd.options.display.float_format = "{:,.2f}".format
 plt.style.use('seaborn-v0_8')
 
+# Also export the cleaned dataset as CSV (Parquet is always written)
+EXPORT_CSV = False
+
+# Pattern for GenderPop values such as '2341093M_2489527F' (counts may be empty).
+# Kept as a string: Arrow-backed columns compile it once per call with RE2 and
+# do not accept pre-compiled re.Pattern objects.
+GENDER_POP_PATTERN = r'(?P<Male>\d*)M_(?P<Female>\d*)F'
+
+
+@njit(cache=True)
+def _parse_numeric_bytes(buffer):
+    """Parse rows of fixed-width ASCII bytes into float32.
+
+    Leading/trailing whitespace is skipped, as are a leading '$', single ','
+    thousands separators and a trailing '%'; a leading '-' is honoured. Blank
+    rows become NaN. Returns the parsed values and the index of the first row
+    that is not a valid number (-1 if every row parsed).
+    """
+    out = np.empty(buffer.shape[0], dtype=np.float32)
+    for i in range(buffer.shape[0]):
+        value = 0.0
+        divisor = 1.0
+        seen_digit = False
+        seen_point = False
+        negative = False
+        seen_percent = False
+        after_comma = False
+        blank = True
+        ended = False
+        for j in range(buffer.shape[1]):
+            char = buffer[i, j]
+            if char == 0 or char == 32 or char == 9:  # NUL padding or whitespace
+                ended = not blank  # only allowed before or after the value
+                continue
+            if ended or seen_percent:  # nothing but whitespace may follow a space or '%'
+                return out, i
+            blank = False
+            if after_comma and not 48 <= char <= 57:  # ',' must be followed by a digit
+                return out, i
+            after_comma = char == 44
+            if 48 <= char <= 57:
+                value = value * 10.0 + (char - 48)
+                seen_digit = True
+                if seen_point:
+                    divisor *= 10.0
+            elif char == 46:  # '.'
+                if seen_point:
+                    return out, i
+                seen_point = True
+            elif char == 45:  # '-'
+                if seen_digit or seen_point or negative:
+                    return out, i
+                negative = True
+            elif char == 36:  # '$'
+                if seen_digit or seen_point:
+                    return out, i
+            elif char == 44:  # ','
+                if not seen_digit or seen_point:
+                    return out, i
+            elif char == 37:  # '%'
+                if not seen_digit:
+                    return out, i
+                seen_percent = True
+            else:
+                return out, i
+        if after_comma:
+            return out, i
+        if seen_digit:
+            out[i] = -value / divisor if negative else value / divisor
+        elif blank:
+            out[i] = np.nan
+        else:
+            return out, i
+    return out, -1
+
+
+def parse_numeric_column(column):
+    """Convert a formatted text column (e.g. '$43,296.36' or '3.75%') to float32 in one pass."""
+    text = column.to_numpy(dtype=object, na_value='')
+    # Fixed-width copy: N x (longest value) bytes, so one very long outlier widens
+    # every row. Fine for short currency/percentage strings like these columns.
+    try:
+        raw = np.array(text, dtype='S')
+    except UnicodeEncodeError:
+        # Non-ASCII bytes become '?', which the kernel rejects with the offending row
+        raw = np.array([value.encode('ascii', 'replace') for value in text], dtype='S')
+    values, bad_row = _parse_numeric_bytes(raw.view(np.uint8).reshape(len(raw), raw.itemsize))
+    if bad_row >= 0:
+        raise ValueError(f"could not convert {text[bad_row]!r} in column {column.name!r} to a number")
+    return values
+
+
+# Sanity check: malformed values must raise rather than parse to a wrong number
+for malformed in ['1 2', '$4 3,000', '$1,,000', '1.5,0', '1,', '12%3', '€5']:
+    try:
+        parse_numeric_column(pd.Series([malformed], name='check'))
+    except ValueError:
+        continue
+    raise AssertionError(f"parse_numeric_column accepted malformed value {malformed!r}")
+
 # =============================================================================
 # 2) DATA ACQUISITION - READING MULTIPLE CSV FILES
 # =============================================================================
@@ -32,15 +137,35 @@ print("🔍 Searching for census data files...")
 files = glob.glob('states*.csv')
 print(f"📁 Found {len(files)} files: {files}")
 
-# Read and combine all CSV files into a single DataFrame
-df_list = []
-for file in files:
-    print(f"📊 Loading data from {file}...")
-    data = pd.read_csv(file)
-    df_list.append(data)
+# Only parse the columns used downstream (skips the unnamed index column)
+columns_to_load = ['State', 'TotalPop', 'Hispanic', 'White', 'Black', 'Native', 'Asian', 'Pacific',
+                   'Income', 'GenderPop']
+
+# Read every CSV file with PyArrow's multithreaded columnar parser
+read_options = pacsv.ReadOptions(use_threads=True)
+convert_options = pacsv.ConvertOptions(
+    include_columns=columns_to_load,
+    column_types={'TotalPop': pa.int32(), **{col: pa.string() for col in columns_to_load[2:]}},
+    strings_can_be_null=True,
+)
+
+def load_table(file):
+    """Parse a single census CSV file into an Arrow table."""
+    return pacsv.read_csv(file, read_options=read_options, convert_options=convert_options)
 
-# Concatenate all DataFrames into one comprehensive dataset
-df = pd.concat(df_list, ignore_index=True)
+tables = []
+# The parser releases the GIL, so a thread pool overlaps disk I/O and parsing across files
+with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+    # Report each file from the main thread as its parsed table comes back (in file order)
+    for file, table in zip(files, executor.map(load_table, files)):
+        print(f"📊 Loaded data from {file}")
+        tables.append(table)
+
+# Concatenate all Arrow tables once and hand the result to pandas
+df = pa.concat_tables(tables, promote_options='default').to_pandas(types_mapper=pd.ArrowDtype)
+
+# Store State as a categorical (integer codes + lookup table) for compact grouping
+df['State'] = df['State'].astype('category')
 print(f"✅ Combined dataset shape: {df.shape}")
 
 # =============================================================================
@@ -48,23 +173,19 @@ print(f"✅ Combined dataset shape: {df.shape}")
 # =============================================================================
 
 print("\n💰 Cleaning Income column...")
-# Remove dollar signs and commas, convert to numeric format
-df['Income'] = df['Income'].replace('[$,]', '', regex=True).astype(float)
-print(f"📈 Income statistics: Mean=${df['Income'].mean():,.0f}, Max=${df['Income'].max():,.0f}")
+# Remove dollar signs and commas and convert to numeric format in a single compiled pass.
+# Cleaned columns are collected as arrays and written to the frame in one step (section 6).
+income_values = parse_numeric_column(df['Income'])
+print(f"📈 Income statistics: Mean=${np.nanmean(income_values):,.0f}, Max=${np.nanmax(income_values):,.0f}")
 
 # =============================================================================
 # 4) DATA CLEANING - GENDER POPULATION SPLITTING
 # =============================================================================
 
 print("\n👥 Processing gender population data...")
-# Split GenderPop column into separate Male and Female columns
-gender_split = df['GenderPop'].str.split('_', expand=True)
-
-# Remove trailing 'M' and 'F' characters, convert to integers
-df[['Male', 'Female']] = gender_split.apply(lambda x: x.str[:-1]).replace('', pd.NA).astype('Int64')
-
-# Remove original GenderPop column and reorder columns
-df = df[['State', 'TotalPop', 'Hispanic', 'White', 'Black', 'Native', 'Asian', 'Pacific', 'Income', 'Male', 'Female']]
+# Extract Male and Female counts from GenderPop in a single regex pass,
+# treating empty counts (e.g. '2872643M_F') as missing
+gender_counts = df['GenderPop'].str.extract(GENDER_POP_PATTERN).replace('', pd.NA).astype('Int32')
 print("✅ Gender data successfully split and formatted")
 
 # =============================================================================
@@ -75,8 +196,9 @@ print("\n📊 Cleaning percentage-based demographic columns...")
 # List of demographic columns containing percentage data
 demographic_cols = ['Hispanic', 'White', 'Black', 'Native', 'Asian', 'Pacific']
 
-# Remove percentage signs and convert to float values
-df[demographic_cols] = df[demographic_cols].replace('%', '', regex=True).astype(float)
+# Strip percentage signs and convert to float32 values with the compiled parser.
+# The 2D array is kept and reused for imputation and plotting below.
+demographic_values = np.column_stack([parse_numeric_column(df[col]) for col in demographic_cols])
 print("✅ Percentage formatting removed from demographic data")
 
 # =============================================================================
@@ -85,12 +207,25 @@ print("✅ Percentage formatting removed from demographic data")
 
 print("\n🔍 Checking for duplicate entries...")
 initial_count = len(df)
-duplicate_count = df.duplicated().sum()
+# Apply all cleaned columns and drop GenderPop in one chain, so duplicates are
+# detected on cleaned values (e.g. '$1,000.00 ' and '$1000.00' compare equal)
+df = (
+    df.assign(Income=income_values, Male=gender_counts['Male'], Female=gender_counts['Female'],
+              **dict(zip(demographic_cols, demographic_values.T)))
+    .astype({'TotalPop': 'Int32'})
+    [['State', 'TotalPop', *demographic_cols, 'Income', 'Male', 'Female']]
+)
+
+# Hash the rows once and reuse the mask for both counting and dropping
+duplicate_mask = df.duplicated()
+duplicate_count = int(duplicate_mask.sum())
 
 print(f"📈 Found {duplicate_count} duplicate rows out of {initial_count} total rows")
 
 # Remove duplicates and reset index for clean data structure
-df = df.drop_duplicates().reset_index(drop=True)
+keep_rows = ~duplicate_mask.to_numpy()
+df = df.loc[keep_rows].reset_index(drop=True)
+demographic_values = demographic_values[keep_rows]
 final_count = len(df)
 print(f"✅ Removed {initial_count - final_count} duplicates. Final dataset: {final_count} rows")
 
@@ -100,8 +235,10 @@ print(f"✅ Removed {initial_count - final_count} duplicates. Final dataset: {fi
 
 print("\n🎛️ Creating derived features...")
 # Calculate proportion of female population for each state
-df['Female_Proportion'] = df['Female'] / df['TotalPop']
-df['Female_Proportion'] = df['Female_Proportion'].astype(float)
+# Divide directly in float32 (missing female counts become NaN)
+female = df['Female'].to_numpy(dtype=np.float32, na_value=np.nan)
+total = df['TotalPop'].to_numpy(dtype=np.float32)
+df['Female_Proportion'] = female / total
 print("✅ Female proportion feature created")
 
 # =============================================================================
@@ -109,22 +246,26 @@ print("✅ Female proportion feature created")
 # =============================================================================
 
 print("\n📈 Creating Income vs Female Proportion visualization...")
-plt.figure(figsize=(10, 6))
-sns.scatterplot(data=df, x='Female_Proportion', y='Income', hue='State', s=80, alpha=0.7)
-
-plt.xlabel('Proportion of Female Population', fontsize=12)
-plt.ylabel('Average Income ($)', fontsize=12)
-plt.title('State Income vs Female Population Proportion', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-
-# Add trend line to show correlation
-z = np.polyfit(df['Female_Proportion'], df['Income'], 1)
-p = np.poly1d(z)
-plt.plot(df['Female_Proportion'], p(df['Female_Proportion']), "r--", alpha=0.8)
-
-plt.tight_layout()
-plt.savefig('income_vs_female_proportion.png', dpi=300, bbox_inches='tight')
-plt.show()
+x = df['Female_Proportion'].to_numpy(dtype=np.float32)
+y = df['Income'].to_numpy(dtype=np.float32)
+
+# One scatter call colour-coded by the State category codes (a 51-entry legend is unreadable)
+fig, ax = plt.subplots(figsize=(10, 6))
+ax.scatter(x, y, c=df['State'].cat.codes, cmap='tab20', s=80, alpha=0.7)
+
+ax.set_xlabel('Proportion of Female Population', fontsize=12)
+ax.set_ylabel('Average Income ($)', fontsize=12)
+ax.set_title('State Income vs Female Population Proportion', fontsize=14, fontweight='bold')
+ax.grid(True, alpha=0.3)
+
+# Add trend line to show correlation (fitted on states with a known female count)
+valid = ~np.isnan(x)
+slope, intercept = np.polyfit(x[valid], y[valid], 1)
+ax.plot(x[valid], slope * x[valid] + intercept, "r--", alpha=0.8)
+
+fig.tight_layout()
+fig.savefig('income_vs_female_proportion.png', dpi=150)
+plt.close(fig)
 print("✅ Scatter plot saved as 'income_vs_female_proportion.png'")
 
 # =============================================================================
@@ -133,7 +274,10 @@ print("✅ Scatter plot saved as 'income_vs_female_proportion.png'")
 
 print("\n🔍 Assessing data completeness...")
 print("Missing values per column:")
-missing_data = df.isnull().sum()
+# Count NaNs with a single reduction over the numeric columns as one float array
+numeric = df.select_dtypes('number')
+missing_counts = np.isnan(numeric.to_numpy(dtype=float, na_value=np.nan)).sum(axis=0)
+missing_data = pd.Series(missing_counts, index=numeric.columns)
 print(missing_data[missing_data > 0])
 
 # =============================================================================
@@ -141,11 +285,11 @@ print(missing_data[missing_data > 0])
 # =============================================================================
 
 print("\n🔄 Imputing missing demographic values...")
-# Fill missing demographic percentages by distributing remaining percentage
-df[demographic_cols] = df[demographic_cols].apply(
-    lambda row: row.fillna(100 - row.sum()) if row.isna().any() else row, 
-    axis=1
-)
+# Fill missing demographic percentages with the remaining percentage of each row
+missing_mask = np.isnan(demographic_values)
+remainder = 100 - np.nansum(demographic_values, axis=1)
+demographic_values[missing_mask] = np.broadcast_to(remainder[:, None], demographic_values.shape)[missing_mask]
+df[demographic_cols] = demographic_values
 print("✅ Missing demographic values imputed")
 
 # =============================================================================
@@ -153,29 +297,32 @@ print("✅ Missing demographic values imputed")
 # =============================================================================
 
 print("\n📊 Creating demographic distribution histograms...")
-# Create individual histograms for each demographic group
-for demographic in demographic_cols:
-    plt.figure(figsize=(10, 6))
-    plt.hist(df[demographic], bins=15, edgecolor='black', alpha=0.7, color='skyblue')
+# Pre-bin every demographic column with NumPy (15 bins over each column's range)
+histograms = [np.histogram(demographic_values[:, j], bins=15) for j in range(demographic_values.shape[1])]
+
+# Draw all demographic histograms on a single 2x3 grid figure
+fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+for j, (ax, demographic, (counts, edges)) in enumerate(zip(axes.flat, demographic_cols, histograms)):
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           edgecolor='black', alpha=0.7, color='skyblue')
     
-    plt.xlabel(f'{demographic} Population Percentage', fontsize=12)
-    plt.ylabel('Number of States', fontsize=12)
-    plt.title(f'Distribution of {demographic} Population Across States', 
-              fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
+    ax.set_xlabel(f'{demographic} Population Percentage', fontsize=12)
+    ax.set_ylabel('Number of States', fontsize=12)
+    ax.set_title(f'Distribution of {demographic} Population Across States', 
+                 fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3)
     
     # Add statistical annotations
-    mean_val = df[demographic].mean()
-    median_val = df[demographic].median()
-    plt.axvline(mean_val, color='red', linestyle='--', label=f'Mean: {mean_val:.1f}%')
-    plt.axvline(median_val, color='green', linestyle='--', label=f'Median: {median_val:.1f}%')
-    plt.legend()
-    
-    filename = f'{demographic.lower()}_distribution.png'
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    plt.show()
-    print(f"✅ Histogram saved as '{filename}'")
+    mean_val = demographic_values[:, j].mean()
+    median_val = np.median(demographic_values[:, j])
+    ax.axvline(mean_val, color='red', linestyle='--', label=f'Mean: {mean_val:.1f}%')
+    ax.axvline(median_val, color='green', linestyle='--', label=f'Median: {median_val:.1f}%')
+    ax.legend()
+
+fig.tight_layout()
+fig.savefig('demographic_distributions.png', dpi=150)
+plt.close(fig)
+print("✅ Histograms saved as 'demographic_distributions.png'")
 
 # =============================================================================
 # 12) DATASET SUMMARY AND VALIDATION
@@ -193,19 +340,27 @@ print("\n📈 Key Statistics:")
 print(df[['TotalPop', 'Income', 'Female_Proportion'] + demographic_cols].describe())
 
 print("\n🏆 Top 5 States by Income:")
-top_income_states = df.nlargest(5, 'Income')[['State', 'Income', 'Female_Proportion']]
+# Partition for the top 5 incomes in O(n), then sort just those 5
+income = df['Income'].to_numpy()
+top_idx = np.argpartition(-income, min(5, len(income) - 1))[:5]
+top_idx = top_idx[np.argsort(-income[top_idx])]
+top_income_states = df.iloc[top_idx][['State', 'Income', 'Female_Proportion']]
 print(top_income_states.to_string(index=False))
 
 print("\n✅ Data cleaning and analysis completed successfully!")
 print("📁 Output files generated:")
 print("   - income_vs_female_proportion.png")
-for demo in demographic_cols:
-    print(f"   - {demo.lower()}_distribution.png")
+print("   - demographic_distributions.png")
 
 # =============================================================================
 # 13) DATA EXPORT (OPTIONAL)
 # =============================================================================
 
-# Export cleaned data for future use
-df.to_csv('cleaned_us_census_data.csv', index=False)
-print("\n💾 Cleaned dataset exported as 'cleaned_us_census_data.csv'")
\ No newline at end of file
+# Export cleaned data for future use as columnar, compressed Parquet
+df.to_parquet('cleaned_us_census_data.parquet', engine='pyarrow', index=False,
+              compression='zstd', use_dictionary=True)
+print("\n💾 Cleaned dataset exported as 'cleaned_us_census_data.parquet'")
+
+if EXPORT_CSV:
+    df.to_csv('cleaned_us_census_data.csv', index=False)
+    print("💾 Cleaned dataset exported as 'cleaned_us_census_data.csv'")